@@ -1,8 +1,10 @@
+import json
 import os
+import re
 import sys
 from typing import Dict, List
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from pydantic import BaseModel, Field
 from loguru import logger
 
@@ -17,6 +19,12 @@ from utils.redbook import (  # noqa: E402
     search_notes,
     shutdown_browser,
 )
+from utils.tracing import request_trace, setup_logging, span, timing_breakdown  # noqa: E402
+
+
+setup_logging()
+
+REQUEST_ID_PATTERN = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
 
 
 class SearchRequest(BaseModel):
@@ -52,6 +60,20 @@ app = FastAPI(
 )
 
 
+@app.middleware("http")
+async def trace_request(request: Request, call_next):
+    trace_id = request.headers.get("X-Request-ID")
+    if trace_id and not REQUEST_ID_PATTERN.match(trace_id):
+        trace_id = None
+    with request_trace(f"{request.method} {request.url.path}", trace_id) as trace:
+        response = await call_next(request)
+
+    response.headers["X-Request-ID"] = trace["trace_id"]
+    if request.headers.get("X-Debug-Timing", "").lower() in ("1", "true", "yes", "on"):
+        response.headers["X-Debug-Timing"] = json.dumps(timing_breakdown(trace), separators=(",", ":"))
+    return response
+
+
 @app.on_event("shutdown")
 async def cleanup_browser():
     await shutdown_browser()
@@ -79,7 +101,8 @@ async def health_check():
 @app.post("/api/login", response_model=LoginResponse)
 async def api_login():
     try:
-        result = await login_action()
+        with span("api.handler"):
+            result = await login_action()
         return LoginResponse(success=True, message=result)
     except Exception as e:
         logger.error(f"登录API出错: {str(e)}")
@@ -89,7 +112,8 @@ async def api_login():
 @app.post("/api/search", response_model=SearchResponse)
 async def api_search(request: SearchRequest):
     try:
-        result = await search_notes(request.keywords, request.limit)
+        with span("api.handler"):
+            result = await search_notes(request.keywords, request.limit)
         if isinstance(result, list):
             return SearchResponse(
                 success=True,
@@ -106,7 +130,8 @@ async def api_search(request: SearchRequest):
 @app.post("/api/note-content", response_model=NoteContentResponse)
 async def api_get_note_content(request: NoteContentRequest):
     try:
-        result = await get_note_content(request.url)
+        with span("api.handler"):
+            result = await get_note_content(request.url)
         return NoteContentResponse(
             success=True,
             data=result,
@@ -15,6 +15,10 @@ from utils.redbook import (  # noqa: E402
     login_action,
     search_notes as redbook_search_notes,
 )
+from utils.tracing import request_trace, setup_logging  # noqa: E402
+
+
+setup_logging()
 
 
 MCP_TRANSPORT = os.getenv("MCP_TRANSPORT", "http")
@@ -26,17 +30,20 @@ mcp = FastMCP("xiaohongshu_scraper")
 
 @mcp.tool(name="login")
 async def login() -> str:
-    return await login_action()
+    with request_trace("mcp.login"):
+        return await login_action()
 
 
 @mcp.tool()
 async def search_notes(keywords: str, limit: int = 30) -> List[Dict[str, str]]:
-    return await redbook_search_notes(keywords, limit)
+    with request_trace("mcp.search_notes"):
+        return await redbook_search_notes(keywords, limit)
 
 
 @mcp.tool()
 async def get_note_content(url: str) -> str:
-    return await redbook_get_note_content(url)
+    with request_trace("mcp.get_note_content"):
+        return await redbook_get_note_content(url)
 
 
 def run_mcp_server():
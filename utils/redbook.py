@@ -1,18 +1,28 @@
 from typing import List, Dict
-import sys
+import os
 import asyncio
+from contextlib import asynccontextmanager
 from urllib.parse import quote
 from loguru import logger
 from playwright.async_api import async_playwright
 
+from utils.tracing import span
 
-logger.remove()
-logger.level("DEBUG")
-logger.add(
-    sys.stdout,
-    colorize=True,
-    format="<g>{time:YYYY-MM-DD HH:mm:ss}</g> | {level} | {message}",
-)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# cdp: 连接外部 Chromium (run.sh 启动的容器)；launch: 自行启动无头 Chromium
+BROWSER_MODE = os.getenv("BROWSER_MODE", "cdp")
+BROWSER_CDP_URL = os.getenv("BROWSER_CDP_URL", "http://localhost:9222")
+BROWSER_USER_DATA_DIR = os.getenv("BROWSER_USER_DATA_DIR", os.path.join(PROJECT_ROOT, "user-data"))
+BROWSER_HEADLESS = os.getenv("BROWSER_HEADLESS", "true").lower() not in ("0", "false", "no")
+BROWSER_WORKERS = max(1, int(os.getenv("BROWSER_WORKERS", "2")))
+
+LOGIN_SELECTORS = [
+    'text="登录"',
+    'button:has-text("登录")',
+    'a:has-text("登录")',
+]
 
 
 class BrowserManager:
@@ -23,16 +33,35 @@ class BrowserManager:
         self.main_page = None
         self.is_logged_in = False
         self.playwright = None
+        self.worker_browser = None
+        self.worker_contexts = []
+        self._idle_pages = None
         self._lock = asyncio.Lock()
 
+    async def _start_cdp(self):
+        """连接外部 Chromium (remote-chromium 容器) 的默认上下文"""
+        playwright_instance = await self.playwright.chromium.connect_over_cdp(BROWSER_CDP_URL)
+        self.browser_context = playwright_instance.contexts[0]
+
+    async def _start_launch(self):
+        """基于持久化用户目录自行启动 Chromium"""
+        os.makedirs(BROWSER_USER_DATA_DIR, exist_ok=True)
+        self.browser_context = await self.playwright.chromium.launch_persistent_context(
+            BROWSER_USER_DATA_DIR,
+            headless=BROWSER_HEADLESS,
+        )
+
     async def ensure_browser(self):
         """确保浏览器已启动并登录"""
         async with self._lock:
             if self.browser_context is None:
                 try:
                     self.playwright = await async_playwright().start()
-                    playwright_instance = await self.playwright.chromium.connect_over_cdp("http://localhost:9222")
-                    self.browser_context = playwright_instance.contexts[0]
+                    if BROWSER_MODE == "launch":
+                        logger.info(f"启动本地 Chromium (user-data: {BROWSER_USER_DATA_DIR}, headless={BROWSER_HEADLESS}) ...")
+                        await self._start_launch()
+                    else:
+                        await self._start_cdp()
                     logger.info("打开一个新标签页 ...")
 
                     valid_pages = [p for p in self.browser_context.pages if not p.is_closed()]
@@ -57,12 +86,7 @@ class BrowserManager:
                     await self.main_page.goto("https://www.xiaohongshu.com", timeout=60000)
                     await asyncio.sleep(3)
 
-                    login_selector = [
-                        'text="登录"',
-                        'button:has-text("登录")',
-                        'a:has-text("登录")',
-                    ]
-                    for selector in login_selector:
+                    for selector in LOGIN_SELECTORS:
                         if await self.main_page.query_selector(selector):
                             return False
                     self.is_logged_in = True
@@ -73,9 +97,131 @@ class BrowserManager:
 
             return True
 
+    async def _ensure_workers(self):
+        """初始化抓取用的页面池
+
+        cdp 模式下只有主标签页一个 worker；launch 模式下为每个 worker 创建独立的
+        BrowserContext，并复制已登录会话的 storage state，避免页面之间争用缓存和 cookie 写入。
+        """
+        async with self._lock:
+            if self._idle_pages is not None:
+                if self.worker_browser is None or self.worker_browser.is_connected():
+                    return
+                logger.warning("worker 浏览器已断开，重建页面池")
+                await self._close_workers()
+
+            idle_pages = asyncio.Queue()
+            if BROWSER_MODE != "launch":
+                idle_pages.put_nowait(self.main_page)
+                self._idle_pages = idle_pages
+                return
+
+            try:
+                storage_state = await self.browser_context.storage_state()
+                self.worker_browser = await self.playwright.chromium.launch(headless=BROWSER_HEADLESS)
+                for _ in range(BROWSER_WORKERS):
+                    context = await self.worker_browser.new_context(storage_state=storage_state)
+                    self.worker_contexts.append(context)
+                    page = await context.new_page()
+                    page.set_default_timeout(60000)
+                    idle_pages.put_nowait(page)
+            except Exception as e:
+                logger.error(f"创建浏览器上下文失败: {str(e)}")
+                await self._close_workers()
+                raise
+            logger.info(f"已创建 {BROWSER_WORKERS} 个独立的浏览器上下文")
+            self._idle_pages = idle_pages
+
+    async def _close_workers(self, sync_cookies: bool = False):
+        """关闭 worker 上下文及其浏览器，需在持有锁时调用"""
+        for context in self.worker_contexts:
+            try:
+                if sync_cookies:
+                    await self.browser_context.add_cookies(await context.cookies())
+                await context.close()
+            except Exception as e:
+                logger.error(f"关闭浏览器上下文时出错: {e}")
+        self.worker_contexts = []
+        if self.worker_browser:
+            try:
+                await self.worker_browser.close()
+            except Exception as e:
+                logger.error(f"关闭 worker 浏览器时出错: {e}")
+            self.worker_browser = None
+        if self._idle_pages is not None:
+            # 唤醒仍在旧队列上等待的请求，让它们改用新的页面池
+            self._idle_pages.put_nowait(None)
+        self._idle_pages = None
+
+    async def _reset_workers(self, sync_cookies: bool = False, idle_pages=None):
+        """关闭页面池，下次使用时按最新登录状态重建
+
+        sync_cookies 为 True 时先把 worker 中被站点刷新的 cookie 写回持久化上下文；
+        传入 idle_pages 时仅当它仍是当前页面池才关闭，避免重复重置。
+        """
+        async with self._lock:
+            if idle_pages is not None and idle_pages is not self._idle_pages:
+                return
+            await self._close_workers(sync_cookies)
+
+    async def check_login_wall(self, page) -> bool:
+        """检测页面是否被登录墙拦截，是则标记为未登录"""
+        for selector in LOGIN_SELECTORS:
+            if await page.query_selector(selector):
+                logger.warning("会话已失效，页面需要重新登录")
+                self.is_logged_in = False
+                return True
+        return False
+
+    @asynccontextmanager
+    async def worker_page(self):
+        """从页面池中借出一个空闲页面，用完后归还"""
+        while True:
+            with span("browser.init"):
+                await self._ensure_workers()
+            idle_pages = self._idle_pages
+            with span("browser.acquire"):
+                page = await idle_pages.get()
+            if page is None:
+                # 页面池已被丢弃，把唤醒信号传给下一个等待者后重试
+                idle_pages.put_nowait(None)
+                continue
+            if idle_pages is self._idle_pages:
+                break
+
+        try:
+            if page.is_closed():
+                try:
+                    if BROWSER_MODE == "launch":
+                        page = await page.context.new_page()
+                    elif self.main_page and not self.main_page.is_closed():
+                        page = self.main_page
+                    else:
+                        page = self.main_page = await self.browser_context.new_page()
+                except Exception:
+                    # worker 浏览器或上下文已失效，丢弃整个页面池
+                    await self._reset_workers(idle_pages=idle_pages)
+                    raise
+                page.set_default_timeout(60000)
+            yield page
+        finally:
+            if BROWSER_MODE == "launch" and self.is_logged_in and not page.is_closed():
+                # 把站点在 worker 中刷新的 cookie 写回持久化用户目录
+                try:
+                    await self.browser_context.add_cookies(await page.context.cookies())
+                except Exception as e:
+                    logger.error(f"同步 cookie 时出错: {e}")
+            if idle_pages is self._idle_pages:
+                if self.is_logged_in:
+                    idle_pages.put_nowait(page)
+                else:
+                    # 会话失效时丢弃页面池，重新登录后按最新 storage state 重建
+                    await self._reset_workers(idle_pages=idle_pages)
+
     async def close(self):
         """关闭浏览器资源"""
         try:
+            await self._reset_workers(sync_cookies=True)
             if self.browser_context:
                 await self.browser_context.close()
             if self.playwright:
@@ -106,7 +252,8 @@ def process_url(url: str) -> str:
 
 async def login_action() -> str:
     """登录小红书账号"""
-    login_status = await browser_manager.ensure_browser()
+    with span("browser.ensure"):
+        login_status = await browser_manager.ensure_browser()
     if not login_status:
         return "请先登录小红书账号"
 
@@ -116,8 +263,9 @@ async def login_action() -> str:
     if not browser_manager.main_page:
         return "浏览器初始化失败，请重试"
 
-    await browser_manager.main_page.goto("https://www.xiaohongshu.com", timeout=60000)
-    await asyncio.sleep(3)
+    with span("navigate"):
+        await browser_manager.main_page.goto("https://www.xiaohongshu.com", timeout=60000)
+        await asyncio.sleep(3)
 
     login_elements = await browser_manager.main_page.query_selector_all('text="登录"')
     if login_elements:
@@ -133,6 +281,7 @@ async def login_action() -> str:
             still_login = await browser_manager.main_page.query_selector_all('text="登录"')
             if not still_login:
                 browser_manager.is_logged_in = True
+                await browser_manager._reset_workers()
                 await asyncio.sleep(2)
                 return "登录成功！"
 
@@ -142,115 +291,119 @@ async def login_action() -> str:
         return "登录等待超时。请重试或手动登录后再使用其他功能。"
     else:
         browser_manager.is_logged_in = True
+        await browser_manager._reset_workers()
         return "已登录小红书账号"
 
 
 async def search_notes(keywords: str, limit: int = 30) -> List[Dict[str, str]]:
     """根据关键词搜索半年内评论最多的图文笔记"""
-    login_status = await browser_manager.ensure_browser()
+    with span("browser.ensure"):
+        login_status = await browser_manager.ensure_browser()
     if not login_status:
         logger.error("请先登录小红书账号")
         return []
 
-    if not browser_manager.main_page:
-        logger.error("浏览器初始化失败，请重试")
-        return []
-
     encoded_keywords = quote(keywords)
     search_url = f"https://www.xiaohongshu.com/search_result?keyword={encoded_keywords}"
     try:
-        await browser_manager.main_page.goto(search_url, timeout=60000)
-        await browser_manager.main_page.wait_for_load_state("networkidle")
-        await (await browser_manager.main_page.wait_for_selector("//span[contains(text(), '筛选')]", state="visible")).hover()
-        await asyncio.sleep(0.5)
-        await (await browser_manager.main_page.wait_for_selector("//span[contains(text(), '最多评论')]", state="visible")).click()
-        await asyncio.sleep(0.5)
-        await (await browser_manager.main_page.wait_for_selector("//span[contains(text(), '图文')]", state="visible")).click()
-        await asyncio.sleep(0.5)
-        await (await browser_manager.main_page.wait_for_selector("//span[contains(text(), '半年内')]", state="visible")).click()
-        await asyncio.sleep(0.5)
-        await (await browser_manager.main_page.wait_for_selector("//span[contains(text(), '筛选')]", state="visible")).click()
-        await asyncio.sleep(0.5)
-
-        page_html = await browser_manager.main_page.content()
-        logger.info(f"页面HTML片段: {page_html[10000:10500]}...")
-        logger.info("尝试获取帖子卡片...")
-
-        post_cards = await browser_manager.main_page.query_selector_all("section.note-item")
-        logger.info(f"找到 {len(post_cards)} 个帖子卡片")
-
-        if not post_cards:
-            post_cards = await browser_manager.main_page.query_selector_all("div[data-v-a264b01a]")
-            logger.info(f"使用备用选择器找到 {len(post_cards)} 个帖子卡片")
-
-        post_links = []
-        post_titles = []
-
-        for card in post_cards:
-            try:
-                link_element = await card.query_selector('a[href*="/search_result/"]') if card else None
-                if not link_element:
-                    continue
-
-                href = await link_element.get_attribute("href")
-                if href and "/search_result/" in href:
-                    if href.startswith("/"):
-                        full_url = f"https://www.xiaohongshu.com{href}"
-                    else:
-                        full_url = href
-
-                    post_links.append(full_url)
-
+        async with browser_manager.worker_page() as page:
+            with span("navigate"):
+                await page.goto(search_url, timeout=60000)
+                await page.wait_for_load_state("networkidle")
+                if await browser_manager.check_login_wall(page):
+                    logger.error("请先登录小红书账号")
+                    return []
+                await (await page.wait_for_selector("//span[contains(text(), '筛选')]", state="visible")).hover()
+                await asyncio.sleep(0.5)
+                await (await page.wait_for_selector("//span[contains(text(), '最多评论')]", state="visible")).click()
+                await asyncio.sleep(0.5)
+                await (await page.wait_for_selector("//span[contains(text(), '图文')]", state="visible")).click()
+                await asyncio.sleep(0.5)
+                await (await page.wait_for_selector("//span[contains(text(), '半年内')]", state="visible")).click()
+                await asyncio.sleep(0.5)
+                await (await page.wait_for_selector("//span[contains(text(), '筛选')]", state="visible")).click()
+                await asyncio.sleep(0.5)
+
+            with span("extract"):
+                page_html = await page.content()
+                logger.info(f"页面HTML片段: {page_html[10000:10500]}...")
+                logger.info("尝试获取帖子卡片...")
+
+                post_cards = await page.query_selector_all("section.note-item")
+                logger.info(f"找到 {len(post_cards)} 个帖子卡片")
+
+                if not post_cards:
+                    post_cards = await page.query_selector_all("div[data-v-a264b01a]")
+                    logger.info(f"使用备用选择器找到 {len(post_cards)} 个帖子卡片")
+
+                post_links = []
+                post_titles = []
+
+                for card in post_cards:
                     try:
-                        title_element = await card.query_selector("div.footer a.title span") if card else None
-                        if title_element:
-                            title = await title_element.text_content()
-                        else:
-                            title_element = await card.query_selector("a.title span") if card else None
-                            if title_element:
-                                title = await title_element.text_content()
+                        link_element = await card.query_selector('a[href*="/search_result/"]') if card else None
+                        if not link_element:
+                            continue
+
+                        href = await link_element.get_attribute("href")
+                        if href and "/search_result/" in href:
+                            if href.startswith("/"):
+                                full_url = f"https://www.xiaohongshu.com{href}"
                             else:
-                                text_elements = await card.query_selector_all("span") if card else []
-                                potential_titles = []
-                                for text_el in text_elements:
-                                    text = await text_el.text_content() if text_el else ""
-                                    if text and len(text.strip()) > 5:
-                                        potential_titles.append(text.strip())
-
-                                if potential_titles:
-                                    title = max(potential_titles, key=len)
+                                full_url = href
+
+                            post_links.append(full_url)
+
+                            try:
+                                title_element = await card.query_selector("div.footer a.title span") if card else None
+                                if title_element:
+                                    title = await title_element.text_content()
                                 else:
-                                    if not card:
-                                        title = "未知标题"
+                                    title_element = await card.query_selector("a.title span") if card else None
+                                    if title_element:
+                                        title = await title_element.text_content()
                                     else:
-                                        all_text = await card.evaluate(
-                                            "el => Array.from(el.querySelectorAll('*')).map(node => node.textContent).filter(text => text && text.trim().length > 5)"
-                                        )
-                                        if all_text and isinstance(all_text, list) and all_text:
-                                            title = max(all_text, key=len)
+                                        text_elements = await card.query_selector_all("span") if card else []
+                                        potential_titles = []
+                                        for text_el in text_elements:
+                                            text = await text_el.text_content() if text_el else ""
+                                            if text and len(text.strip()) > 5:
+                                                potential_titles.append(text.strip())
+
+                                        if potential_titles:
+                                            title = max(potential_titles, key=len)
                                         else:
-                                            title = "未知标题"
-
-                        if not title or (isinstance(title, str) and title.strip() == ""):
-                            title = "未知标题"
+                                            if not card:
+                                                title = "未知标题"
+                                            else:
+                                                all_text = await card.evaluate(
+                                                    "el => Array.from(el.querySelectorAll('*')).map(node => node.textContent).filter(text => text && text.trim().length > 5)"
+                                                )
+                                                if all_text and isinstance(all_text, list) and all_text:
+                                                    title = max(all_text, key=len)
+                                                else:
+                                                    title = "未知标题"
+
+                                if not title or (isinstance(title, str) and title.strip() == ""):
+                                    title = "未知标题"
+                            except Exception as e:
+                                logger.info(f"获取标题时出错: {str(e)}")
+                                title = "未知标题"
+
+                            post_titles.append(title)
                     except Exception as e:
-                        logger.info(f"获取标题时出错: {str(e)}")
-                        title = "未知标题"
+                        logger.info(f"处理帖子卡片时出错: {str(e)}")
 
-                    post_titles.append(title)
-            except Exception as e:
-                logger.info(f"处理帖子卡片时出错: {str(e)}")
+                unique_posts = []
+                seen_urls = set()
+                for url, title in zip(post_links, post_titles):
+                    logger.info(f"title: {title}; url: {url}")
+                    if url not in seen_urls:
+                        seen_urls.add(url)
+                        unique_posts.append({"url": url, "title": title})
 
-        unique_posts = []
-        seen_urls = set()
-        for url, title in zip(post_links, post_titles):
-            logger.info(f"title: {title}; url: {url}")
-            if url not in seen_urls:
-                seen_urls.add(url)
-                unique_posts.append({"url": url, "title": title})
-
-        unique_posts = unique_posts[:limit]
-        return unique_posts
+                unique_posts = unique_posts[:limit]
+                return unique_posts
 
     except Exception as e:
         error_message = str(e)
@@ -260,124 +413,123 @@ async def search_notes(keywords: str, limit: int = 30) -> List[Dict[str, str]]:
 
 async def get_note_content(url: str) -> str:
     """获取笔记内容"""
-    login_status = await browser_manager.ensure_browser()
+    with span("browser.ensure"):
+        login_status = await browser_manager.ensure_browser()
     if not login_status:
         return "请先登录小红书账号"
 
-    if not browser_manager.main_page:
-        return "浏览器初始化失败，请重试"
-
     try:
-        processed_url = process_url(url)
-        logger.info(f"处理后的URL: {processed_url}")
-
-        await browser_manager.main_page.goto(processed_url, timeout=60000)
-        await asyncio.sleep(10)
-
-        if not browser_manager.main_page:
-            return "浏览器初始化失败，请重试"
-
-        error_page = await browser_manager.main_page.evaluate(
-            """
-            () => {
-                const errorTexts = [
-                    "当前笔记暂时无法浏览",
-                    "内容不存在",
-                    "页面不存在",
-                    "内容已被删除"
-                ];
-
-                for (const text of errorTexts) {
-                    if (document.body.innerText.includes(text)) {
-                        return {
-                            isError: true,
-                            errorText: text
-                        };
+        async with browser_manager.worker_page() as page:
+            processed_url = process_url(url)
+            logger.info(f"处理后的URL: {processed_url}")
+
+            with span("navigate"):
+                await page.goto(processed_url, timeout=60000)
+                await asyncio.sleep(10)
+
+            with span("render"):
+                if await browser_manager.check_login_wall(page):
+                    return "请先登录小红书账号"
+
+                error_page = await page.evaluate(
+                    """
+                    () => {
+                        const errorTexts = [
+                            "当前笔记暂时无法浏览",
+                            "内容不存在",
+                            "页面不存在",
+                            "内容已被删除"
+                        ];
+
+                        for (const text of errorTexts) {
+                            if (document.body.innerText.includes(text)) {
+                                return {
+                                    isError: true,
+                                    errorText: text
+                                };
+                            }
+                        }
+
+                        return { isError: false };
                     }
-                }
-
-                return { isError: false };
-            }
-        """
-        )
-
-        if error_page.get("isError", False):
-            return f"无法获取笔记内容: {error_page.get('errorText', '未知错误')}\n请检查链接是否有效或尝试使用带有有效token的完整URL。"
-
-        if not browser_manager.main_page:
-            return "浏览器初始化失败，请重试"
-
-        await browser_manager.main_page.evaluate(
-            """
-            () => {
-                window.scrollTo(0, document.body.scrollHeight);
-                setTimeout(() => {
-                    window.scrollTo(0, document.body.scrollHeight / 2);
-                }, 1000);
-                setTimeout(() => {
-                    window.scrollTo(0, 0);
-                }, 2000);
-            }
-        """
-        )
-        await asyncio.sleep(3)
+                """
+                )
+
+                if error_page.get("isError", False):
+                    return f"无法获取笔记内容: {error_page.get('errorText', '未知错误')}\n请检查链接是否有效或尝试使用带有有效token的完整URL。"
+
+                await page.evaluate(
+                    """
+                    () => {
+                        window.scrollTo(0, document.body.scrollHeight);
+                        setTimeout(() => {
+                            window.scrollTo(0, document.body.scrollHeight / 2);
+                        }, 1000);
+                        setTimeout(() => {
+                            window.scrollTo(0, 0);
+                        }, 2000);
+                    }
+                """
+                )
+                await asyncio.sleep(3)
 
-        post_content: Dict[str, str] = {}
+            with span("extract"):
+                post_content: Dict[str, str] = {}
 
-        try:
-            title_element = await browser_manager.main_page.query_selector("#detail-title")
-            if title_element:
-                title = await title_element.text_content()
-                post_content["标题"] = title.strip() if title else "未知标题"
-            else:
-                post_content["标题"] = "未知标题"
-        except Exception as e:
-            logger.info(f"获取标题出错: {str(e)}")
-            post_content["标题"] = "未知标题"
+                try:
+                    title_element = await page.query_selector("#detail-title")
+                    if title_element:
+                        title = await title_element.text_content()
+                        post_content["标题"] = title.strip() if title else "未知标题"
+                    else:
+                        post_content["标题"] = "未知标题"
+                except Exception as e:
+                    logger.info(f"获取标题出错: {str(e)}")
+                    post_content["标题"] = "未知标题"
 
-        try:
-            author_element = await browser_manager.main_page.query_selector("span.username")
-            if author_element:
-                author = await author_element.text_content()
-                post_content["作者"] = author.strip() if author else "未知作者"
-            else:
-                post_content["作者"] = "未知作者"
-        except Exception as e:
-            logger.info(f"获取作者出错: {str(e)}")
-            post_content["作者"] = "未知作者"
+                try:
+                    author_element = await page.query_selector("span.username")
+                    if author_element:
+                        author = await author_element.text_content()
+                        post_content["作者"] = author.strip() if author else "未知作者"
+                    else:
+                        post_content["作者"] = "未知作者"
+                except Exception as e:
+                    logger.info(f"获取作者出错: {str(e)}")
+                    post_content["作者"] = "未知作者"
 
-        try:
-            time_element = await browser_manager.main_page.query_selector("span.date")
-            if time_element:
-                time_text = await time_element.text_content()
-                post_content["发布时间"] = time_text.strip() if time_text else "未知"
-            else:
-                post_content["发布时间"] = "未知"
-        except Exception as e:
-            logger.info(f"获取发布时间出错: {str(e)}")
-            post_content["发布时间"] = "未知"
+                try:
+                    time_element = await page.query_selector("span.date")
+                    if time_element:
+                        time_text = await time_element.text_content()
+                        post_content["发布时间"] = time_text.strip() if time_text else "未知"
+                    else:
+                        post_content["发布时间"] = "未知"
+                except Exception as e:
+                    logger.info(f"获取发布时间出错: {str(e)}")
+                    post_content["发布时间"] = "未知"
 
-        try:
-            content_element = await browser_manager.main_page.query_selector("#detail-desc .note-text")
-            if content_element:
-                content_text = await content_element.text_content()
-                if content_text and len(content_text.strip()) > 50:
-                    post_content["内容"] = content_text.strip()
-                else:
+                try:
+                    content_element = await page.query_selector("#detail-desc .note-text")
+                    if content_element:
+                        content_text = await content_element.text_content()
+                        if content_text and len(content_text.strip()) > 50:
+                            post_content["内容"] = content_text.strip()
+                        else:
+                            post_content["内容"] = "未能获取内容"
+                    else:
+                        post_content["内容"] = "未能获取内容"
+                except Exception as e:
+                    logger.info(f"获取正文内容出错: {str(e)}")
                     post_content["内容"] = "未能获取内容"
-            else:
-                post_content["内容"] = "未能获取内容"
-        except Exception as e:
-            logger.info(f"获取正文内容出错: {str(e)}")
-            post_content["内容"] = "未能获取内容"
 
-        result = f"标题: {post_content['标题']}\n"
-        result += f"作者: {post_content['作者']}\n"
-        result += f"发布时间: {post_content['发布时间']}\n"
-        result += f"链接: {url}\n\n"
-        result += f"内容:\n{post_content['内容']}"
+                result = f"标题: {post_content['标题']}\n"
+                result += f"作者: {post_content['作者']}\n"
+                result += f"发布时间: {post_content['发布时间']}\n"
+                result += f"链接: {url}\n\n"
+                result += f"内容:\n{post_content['内容']}"
 
-        return result
+                return result
 
     except Exception as e:
         return f"获取笔记内容时出错: {str(e)}"
@@ -0,0 +1,95 @@
+import os
+import sys
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+from loguru import logger
+
+
+_trace_id: ContextVar[Optional[str]] = ContextVar("trace_id", default=None)
+_spans: ContextVar[Optional[List[Dict]]] = ContextVar("spans", default=None)
+_started_at: ContextVar[float] = ContextVar("started_at", default=0.0)
+
+
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text")
+
+
+def setup_logging():
+    """配置日志输出，每条日志带 trace_id；LOG_FORMAT=json 时输出 JSON 行供日志采集器解析"""
+    logger.remove()
+    logger.level("DEBUG")
+    logger.configure(patcher=bind_trace_id)
+    if LOG_FORMAT == "json":
+        logger.add(sys.stdout, serialize=True)
+    else:
+        logger.add(
+            sys.stdout,
+            colorize=True,
+            format="<g>{time:YYYY-MM-DD HH:mm:ss}</g> | {level} | {extra[trace_id]} | {message}",
+        )
+
+
+def bind_trace_id(record):
+    """loguru patcher：为每条日志补充 trace_id 字段"""
+    record["extra"].setdefault("trace_id", _trace_id.get() or "-")
+
+
+@contextmanager
+def span(name: str):
+    """记录一个阶段的耗时，字段写入日志的 extra 中"""
+    spans = _spans.get()
+    if spans is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    status = "ok"
+    try:
+        yield
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        record = {
+            "event": "span",
+            "trace_id": _trace_id.get(),
+            "name": name,
+            "start_ms": round((start - _started_at.get()) * 1000, 1),
+            "duration_ms": round((time.perf_counter() - start) * 1000, 1),
+            "status": status,
+        }
+        spans.append(record)
+        logger.bind(**record).debug(f"span {name} {record['duration_ms']}ms {status}")
+
+
+@contextmanager
+def request_trace(name: str, trace_id: Optional[str] = None):
+    """在 API / MCP 入口开启一次请求追踪，结束时输出各阶段耗时汇总"""
+    trace = {"trace_id": trace_id or uuid.uuid4().hex, "spans": []}
+    tokens = (
+        _trace_id.set(trace["trace_id"]),
+        _spans.set(trace["spans"]),
+        _started_at.set(time.perf_counter()),
+    )
+    try:
+        with span(name):
+            yield trace
+    finally:
+        stages = timing_breakdown(trace)
+        logger.bind(event="trace", trace_id=trace["trace_id"], name=name, stages=stages).info(
+            f"trace {name} {stages.get(name, 0.0)}ms"
+        )
+        _started_at.reset(tokens[2])
+        _spans.reset(tokens[1])
+        _trace_id.reset(tokens[0])
+
+
+def timing_breakdown(trace: Dict) -> Dict[str, float]:
+    """按阶段名汇总耗时 (毫秒)，同名阶段累加"""
+    stages: Dict[str, float] = {}
+    for record in trace["spans"]:
+        stages[record["name"]] = round(stages.get(record["name"], 0.0) + record["duration_ms"], 1)
+    return stages